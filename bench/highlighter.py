@@ -0,0 +1,94 @@
+"""
+Per-tab highlighter construction time and memory
+
+usage: python bench/highlighter.py [tabs]
+
+Each mode runs in its own process. "baseline" rebuilds the rules per tab like PythonSyntax did before the
+shared registry, "shared" uses the registry. Time includes the first highlight of every tab, where the
+patterns are compiled. Memory is the process RSS growth, which covers QRegularExpression / JIT / format memory.
+"""
+import builtins
+import keyword
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QSyntaxHighlighter, QTextDocument
+from PySide6.QtWidgets import QApplication
+
+from src.Lcore import PythonSyntax, SyntaxRule, registry
+
+SAMPLE = ROOT.joinpath("src", "ui.py").read_text(encoding="utf-8")
+
+
+class BaselineSyntax(PythonSyntax):
+	"""
+	PythonSyntax before the registry: rules rebuilt per instance, compiled on first match
+	"""
+
+	def __init__(self, parent: QTextDocument | None = None) -> None:
+		QSyntaxHighlighter.__init__(self, parent)
+		self.rule = [
+			SyntaxRule(reg="|".join([r'\b(?<!\.){}\b'.format(bi) for bi in dir(builtins)]), color=Qt.GlobalColor.blue),
+			SyntaxRule(reg="|".join([r'\b(?<!\.){}\b'.format(kw) for kw in keyword.kwlist] + [r'\bself\b']), color=Qt.GlobalColor.darkMagenta),
+			SyntaxRule(reg=r"\b__[a-zA-Z][\da-zA-Z]*__", color=Qt.GlobalColor.magenta),
+			SyntaxRule(reg="|".join([r'\b[0]+\b', r'\b[1-9]+\d+\b', r'\b0[bB][01]+\b', r'\b0[oO][0-7]+\b', r'\b0[xX][\da-fA-F]+\b']), color=Qt.GlobalColor.darkCyan),
+			SyntaxRule(reg=r'"[^"]*?"' + r"|'[^']*?'", color=Qt.GlobalColor.darkGreen),
+			SyntaxRule(reg=r'^\s*#.*', color=Qt.GlobalColor.gray, italic=True),
+		]
+
+
+def rss() -> int:
+	"""
+	resident set size in bytes
+	"""
+	with open("/proc/self/statm") as statm:
+		return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def measure(mode: str, tabs: int) -> None:
+	app = QApplication(sys.argv)
+	highlighter = BaselineSyntax if mode == "baseline" else PythonSyntax
+	keep = []
+	before = rss()
+	start = time.perf_counter()
+	for _ in range(tabs):
+		document = QTextDocument()
+		keep.append((document, highlighter(document)))
+	constructed = time.perf_counter() - start
+	for document, syntax in keep:
+		document.setPlainText(SAMPLE)
+		QSyntaxHighlighter.rehighlight(syntax)
+	elapsed = time.perf_counter() - start
+	grown = rss() - before
+	print(f"{mode:<9} {tabs} tabs: construct {constructed * 1000:8.2f} ms ({constructed / tabs * 1e6:7.1f} us/tab), "
+		  f"+ first highlight {elapsed * 1000:8.2f} ms, RSS +{grown / 1024:9.1f} KiB ({grown / tabs / 1024:6.1f} KiB/tab)")
+	if mode == "shared":
+		# the documents are not shown in an editor, like hidden tabs
+		start = time.perf_counter()
+		registry.setTheme("dark")
+		switched = time.perf_counter() - start
+		start = time.perf_counter()
+		registry.showDocument(keep[0][0])
+		shown = time.perf_counter() - start
+		print(f"theme switch over {tabs} hidden tabs: {switched * 1000:.2f} ms, then showing one tab: {shown * 1000:.2f} ms")
+	app.quit()
+
+
+def main(tabs: int) -> None:
+	for mode in ("baseline", "shared"):
+		subprocess.run([sys.executable, __file__, str(tabs), mode], check=True)
+
+
+if __name__ == '__main__':
+	if len(sys.argv) > 2:
+		measure(sys.argv[2], int(sys.argv[1]))
+	else:
+		main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
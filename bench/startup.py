@@ -0,0 +1,36 @@
+"""
+Time-to-interactive of main.py
+
+usage: python bench/startup.py [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_once() -> dict[str, float]:
+	with tempfile.TemporaryDirectory() as tmp:
+		output = Path(tmp).joinpath("startup.json")
+		env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT), str(ROOT.joinpath("src")), os.environ.get("PYTHONPATH", "")]))
+		subprocess.run([sys.executable, str(ROOT.joinpath("src", "main.py")), f"--startup-profile={output}", "--startup-exit"], cwd=ROOT, env=env, check=True)
+		return json.loads(output.read_text(encoding="utf-8"))
+
+
+def main(runs: int) -> None:
+	samples: dict[str, list[float]] = {}
+	for _ in range(runs):
+		for name, at in run_once().items():
+			samples.setdefault(name, []).append(at * 1000)
+	print(f"{'milestone':<24}{'median':>10}{'min':>10}{'max':>10}  (ms, {runs} runs)")
+	for name, values in samples.items():
+		print(f"{name:<24}{statistics.median(values):>10.2f}{min(values):>10.2f}{max(values):>10.2f}")
+
+
+if __name__ == '__main__':
+	main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
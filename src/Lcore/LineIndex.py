@@ -0,0 +1,73 @@
+class LineIndex:
+	"""
+	Line index of a growing text stream, searched incrementally
+
+	Lines are stored casefolded, line n of the index is block n of the document.
+	"""
+
+	# number of queries whose results are kept
+	cacheSize: int = 8
+
+	def __init__(self) -> None:
+		self.lines: list[str] = [""]
+		# query -> (matched lines, lines scanned), the last (partial) line is never counted as scanned
+		self.__cache: dict[str, tuple[list[int], int]] = {}
+
+	def __len__(self) -> int:
+		return len(self.lines)
+
+	def clear(self) -> None:
+		self.lines = [""]
+		self.__cache.clear()
+
+	def feed(self, text: str) -> None:
+		"""
+		append text of the stream
+
+		Lines end like QTextCursor.insertText splits blocks: "\\r\\n", "\\r", "\\n" and U+2029,
+		a "\\r\\n" split between two calls ends two lines.
+
+		:param text: new text
+		"""
+		parts = text.replace("\r\n", "\n").replace("\r", "\n").replace("\u2029", "\n").casefold().split("\n")
+		self.lines[-1] += parts[0]
+		self.lines.extend(parts[1:])
+
+	def setTail(self, lines: list[str]) -> None:
+		"""
+		replace the last (partial) line, e.g. with the blocks of the document after user input
+
+		:param lines: new lines from the last line on, not empty
+		"""
+		# cached results never count the last line as scanned, so they stay valid
+		self.lines[-1:] = [line.casefold() for line in lines]
+
+	def search(self, query: str) -> list[int]:
+		"""
+		lines containing query (case insensitive)
+
+		Only lines added since the last search are scanned. A query extending a previous one only rechecks its matches.
+
+		:param query: text to find
+		:return: sorted line numbers
+		"""
+		query = query.casefold()
+		if not query:
+			return []
+		if query in self.__cache:
+			matches, scanned = self.__cache.pop(query)
+		else:
+			# refine the longest cached prefix of the query
+			prefix = max((q for q in self.__cache if query.startswith(q)), key=len, default=None)
+			if prefix is not None:
+				matches, scanned = self.__cache[prefix]
+				matches = [n for n in matches if n < scanned and query in self.lines[n]]
+			else:
+				matches, scanned = [], 0
+		matches = [n for n in matches if n < scanned]
+		last = len(self.lines) - 1
+		matches.extend(n for n in range(scanned, last + 1) if query in self.lines[n])
+		self.__cache[query] = (matches, last)
+		while len(self.__cache) > self.cacheSize:
+			del self.__cache[next(iter(self.__cache))]
+		return matches
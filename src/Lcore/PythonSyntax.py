@@ -1,10 +1,14 @@
 import keyword
 import builtins
+import weakref
 
-from PySide6.QtGui import QCursor, QSyntaxHighlighter, QTextCharFormat, QTextDocument, QColor
+from PySide6.QtGui import QCursor, QPalette, QSyntaxHighlighter, QTextCharFormat, QTextDocument, QColor
 from PySide6.QtCore import QRegularExpression, Qt
 
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QWidget
+from shiboken6 import isValid
+
+from src.Lcore.Telemetry import telemetry
 
 
 class SyntaxRule:
@@ -34,6 +38,144 @@ class SyntaxRule:
 			self.format.setFontItalic(True)
 
 
+class SyntaxRegistry:
+	"""
+	Compiled rules and theme formats shared by all highlighters of the process
+	"""
+
+	# category -> (color, italic)
+	themes: dict[str, dict[str, tuple[Qt.GlobalColor | QColor, bool]]] = {
+		"light": {
+			"builtin": (Qt.GlobalColor.blue, False),
+			"keyword": (Qt.GlobalColor.darkMagenta, False),
+			"magic": (Qt.GlobalColor.magenta, False),
+			"number": (Qt.GlobalColor.darkCyan, False),
+			"string": (Qt.GlobalColor.darkGreen, False),
+			"comment": (Qt.GlobalColor.gray, True),
+		},
+		"dark": {
+			"builtin": (QColor("#569cd6"), False),
+			"keyword": (QColor("#c586c0"), False),
+			"magic": (QColor("#dcdcaa"), False),
+			"number": (QColor("#b5cea8"), False),
+			"string": (QColor("#ce9178"), False),
+			"comment": (QColor("#6a9955"), True),
+		},
+	}
+	# editor (background, text), None keeps the application palette
+	palettes: dict[str, tuple[QColor, QColor] | None] = {
+		"light": None,
+		"dark": (QColor("#1e1e1e"), QColor("#d4d4d4")),
+	}
+
+	def __init__(self, theme: str = "light") -> None:
+		self.theme: str = theme
+		self.formats: dict[str, QTextCharFormat] = {category: QTextCharFormat() for category in self.themes[theme]}
+		self.__rules: list[SyntaxRule] | None = None
+		self.__highlighters: weakref.WeakSet[QSyntaxHighlighter] = weakref.WeakSet()
+		self.__editors: weakref.WeakSet[QWidget] = weakref.WeakSet()
+		# highlighters of hidden editors wait for showDocument after a theme switch
+		self.__dirty: weakref.WeakSet[QSyntaxHighlighter] = weakref.WeakSet()
+		self.__applyTheme()
+
+	@property
+	def rules(self) -> list[SyntaxRule]:
+		"""
+		Rules are built and compiled on first use
+		"""
+		if self.__rules is None:
+			self.__rules = self.__buildRules()
+		return self.__rules
+
+	def __buildRules(self) -> list[SyntaxRule]:
+		rules = [
+			#builtins
+			SyntaxRule(reg="|".join([r'\b(?<!\.){}\b'.format(bi) for bi in dir(builtins)]), fmt=self.formats["builtin"]),
+			# keyword
+			SyntaxRule(reg="|".join([r'\b(?<!\.){}\b'.format(kw) for kw in keyword.kwlist] + [r'\bself\b']), fmt=self.formats["keyword"]),
+			# magic function
+			SyntaxRule(reg=r"\b__[a-zA-Z][\da-zA-Z]*__", fmt=self.formats["magic"]),
+			# const number
+			SyntaxRule(reg="|".join([r'\b[0]+\b', r'\b[1-9]+\d+\b', r'\b0[bB][01]+\b', r'\b0[oO][0-7]+\b', r'\b0[xX][\da-fA-F]+\b']), fmt=self.formats["number"]),
+			# const string
+			SyntaxRule(reg=r'"[^"]*?"' + r"|'[^']*?'", fmt=self.formats["string"]),
+			# comment
+			SyntaxRule(reg=r'^\s*#.*', fmt=self.formats["comment"]),
+		]
+		for rl in rules:
+			# compile now (JIT enabled) instead of on the first match
+			rl.rule.optimize()
+		return rules
+
+	def __applyTheme(self) -> None:
+		for category, (color, italic) in self.themes[self.theme].items():
+			fmt = self.formats[category]
+			fmt.setForeground(color)
+			fmt.setFontItalic(italic)
+
+	def register(self, highlighter: QSyntaxHighlighter) -> None:
+		self.__highlighters.add(highlighter)
+
+	def registerEditor(self, editor: QWidget) -> None:
+		"""
+		Keep the background and text color of editor in line with the theme
+		"""
+		self.__editors.add(editor)
+		self.__applyPalette(editor)
+
+	def __applyPalette(self, editor: QWidget) -> None:
+		colors = self.palettes.get(self.theme)
+		if colors is None:
+			# empty palette, inherit from the parent again
+			editor.setPalette(QPalette())
+			return
+		palette = editor.palette()
+		palette.setColor(QPalette.ColorRole.Base, colors[0])
+		palette.setColor(QPalette.ColorRole.Text, colors[1])
+		editor.setPalette(palette)
+
+	def setTheme(self, theme: str) -> None:
+		"""
+		Switch theme of all highlighters and editors, the compiled rules are kept
+
+		Only documents of visible editors are rehighlighted now, the others on showDocument.
+
+		:param theme: name in themes
+		"""
+		if theme not in self.themes:
+			raise KeyError(f"unknown theme {theme}")
+		if theme == self.theme:
+			return
+		self.theme = theme
+		self.__applyTheme()
+		visible = set()
+		for editor in list(self.__editors):
+			if isValid(editor):
+				self.__applyPalette(editor)
+				if editor.isVisible():
+					visible.add(editor.document())
+		for highlighter in list(self.__highlighters):
+			if not isValid(highlighter):
+				continue
+			if highlighter.document() in visible:
+				self.__dirty.discard(highlighter)
+				highlighter.rehighlight()
+			else:
+				self.__dirty.add(highlighter)
+
+	def showDocument(self, document: QTextDocument) -> None:
+		"""
+		Rehighlight document if the theme changed while it was hidden
+		"""
+		for highlighter in list(self.__dirty):
+			if isValid(highlighter) and highlighter.document() == document:
+				self.__dirty.discard(highlighter)
+				highlighter.rehighlight()
+
+
+registry = SyntaxRegistry()
+
+
 class PythonSyntax(QSyntaxHighlighter):
 	"""
 	Highlighter of Python code
@@ -41,24 +183,10 @@ class PythonSyntax(QSyntaxHighlighter):
 
 	def __init__(self, parent: QTextDocument | None = None) -> None:
 		super().__init__(parent)
-		self.rule: list[SyntaxRule] = []
-		self.setup_rule()
-
-	def setup_rule(self) -> None:
-		#builtins
-		self.rule.append(SyntaxRule(reg="|".join([r'\b(?<!\.){}\b'.format(bi) for bi in dir(builtins)]), color=Qt.GlobalColor.blue))
-		# keyword
-		self.rule.append(SyntaxRule(reg="|".join([r'\b(?<!\.){}\b'.format(kw) for kw in keyword.kwlist] + [r'\bself\b']), color=Qt.GlobalColor.darkMagenta))
-		# magic function
-		self.rule.append(SyntaxRule(reg=r"\b__[a-zA-Z][\da-zA-Z]*__", color=Qt.GlobalColor.magenta))
-		# const number
-		self.rule.append(
-			SyntaxRule(reg="|".join([r'\b[0]+\b', r'\b[1-9]+\d+\b', r'\b0[bB][01]+\b', r'\b0[oO][0-7]+\b', r'\b0[xX][\da-fA-F]+\b']), color=Qt.GlobalColor.darkCyan))
-		# const string
-		self.rule.append(SyntaxRule(reg=r'"[^"]*?"' + r"|'[^']*?'", color=Qt.GlobalColor.darkGreen))
-		# comment
-		self.rule.append(SyntaxRule(reg=r'^\s*#.*', color=Qt.GlobalColor.gray, italic=True))
+		self.rule: list[SyntaxRule] = registry.rules
+		registry.register(self)
 
+	@telemetry.timed("PythonSyntax.highlightBlock")
 	def highlightBlock(self, text: str) -> None:
 		for rl in self.rule:
 			i = rl.rule.globalMatch(text)
@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+
+class StartupTimeline:
+	"""
+	Timeline of startup milestones (import, widget construction, first paint, first file open ...)
+
+	Enabled by ``--startup-profile[=file]`` or the ``PYTHONEXP_STARTUP`` environment variable.
+	When disabled every call is a no-op.
+	"""
+
+	def __init__(self) -> None:
+		self.origin: float = time.perf_counter()
+		self.marks: list[tuple[str, float]] = []
+		self.output: Path | None = None
+		self.exitWhenInteractive: bool = "--startup-exit" in sys.argv
+		self.enabled: bool = bool(os.environ.get("PYTHONEXP_STARTUP"))
+		for arg in sys.argv:
+			if arg == "--startup-profile":
+				self.enabled = True
+			elif arg.startswith("--startup-profile="):
+				self.enabled = True
+				self.output = Path(arg.split("=", 1)[1])
+
+	def mark(self, name: str) -> None:
+		"""
+		record a milestone, only the first occurrence of each name is kept
+
+		:param name: name of the milestone
+		"""
+		if not self.enabled or self.has(name):
+			return
+		self.marks.append((name, time.perf_counter() - self.origin))
+
+	def has(self, name: str) -> bool:
+		return any(mark == name for mark, _ in self.marks)
+
+	def report(self) -> str:
+		lines = []
+		last = 0.0
+		for name, at in self.marks:
+			lines.append(f"{at * 1000:10.2f} ms  (+{(at - last) * 1000:8.2f} ms)  {name}")
+			last = at
+		return "\n".join(lines)
+
+	def dump(self) -> None:
+		"""
+		write the timeline to the output file (json) or stderr (text)
+		"""
+		if not self.enabled:
+			return
+		if self.output is not None:
+			self.output.write_text(json.dumps({name: at for name, at in self.marks}), encoding="utf-8")
+		else:
+			print(self.report(), file=sys.stderr)
+
+
+startup = StartupTimeline()
@@ -0,0 +1,177 @@
+import functools
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from PySide6.QtCore import QObject, QTimer
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Metric:
+	"""
+	Timer with a log2 histogram of durations in microseconds
+	"""
+
+	# bucket i holds durations in [2^i, 2^(i+1)) us, the last one holds the rest
+	bucketCount: int = 24
+
+	def __init__(self, name: str) -> None:
+		self.name = name
+		self.count = 0
+		self.total = 0.0
+		self.max = 0.0
+		self.buckets: list[int] = [0] * self.bucketCount
+
+	def add(self, seconds: float) -> None:
+		self.count += 1
+		self.total += seconds
+		if seconds > self.max:
+			self.max = seconds
+		us = int(seconds * 1e6)
+		self.buckets[min(max(us.bit_length() - 1, 0), self.bucketCount - 1)] += 1
+
+	@property
+	def mean(self) -> float:
+		return self.total / self.count if self.count else 0.0
+
+	@staticmethod
+	def bucketLabel(index: int) -> str:
+		us = 1 << index
+		return f"{us}us" if us < 1000 else f"{us / 1000:g}ms"
+
+	def toDict(self) -> dict[str, Any]:
+		return {
+			"count": self.count,
+			"total_ms": self.total * 1000,
+			"mean_ms": self.mean * 1000,
+			"max_ms": self.max * 1000,
+			"histogram": {self.bucketLabel(i): n for i, n in enumerate(self.buckets) if n},
+		}
+
+
+class Telemetry:
+	"""
+	Timers and counters of the IDE itself
+
+	Enabled by ``setEnabled`` or the ``PYTHONEXP_TELEMETRY`` environment variable.
+	When disabled a timed function costs one attribute check.
+	"""
+
+	def __init__(self) -> None:
+		self.enabled: bool = bool(os.environ.get("PYTHONEXP_TELEMETRY"))
+		self.origin: float = time.perf_counter()
+		self.timers: dict[str, Metric] = {}
+		self.counters: dict[str, int] = {}
+		# (phase, name, start, duration | value) for trace export
+		self.events: deque[tuple[str, str, float, float]] = deque(maxlen=200000)
+		self.lagMonitor: LagMonitor | None = None
+
+	def setEnabled(self, enabled: bool) -> None:
+		self.enabled = enabled
+		if self.lagMonitor is not None:
+			self.lagMonitor.setRunning(enabled)
+
+	def reset(self) -> None:
+		self.timers.clear()
+		self.counters.clear()
+		self.events.clear()
+
+	def record(self, name: str, start: float, seconds: float) -> None:
+		"""
+		:param name: timer name
+		:param start: perf_counter() at start
+		:param seconds: duration
+		"""
+		metric = self.timers.get(name)
+		if metric is None:
+			metric = self.timers[name] = Metric(name)
+		metric.add(seconds)
+		self.events.append(("X", name, start, seconds))
+
+	def count(self, name: str, value: int = 1) -> None:
+		if not self.enabled:
+			return
+		total = self.counters[name] = self.counters.get(name, 0) + value
+		self.events.append(("C", name, time.perf_counter(), total))
+
+	def timed(self, name: str) -> Callable[[F], F]:
+		"""
+		decorator timing every call of a function
+		"""
+
+		def decorator(func: F) -> F:
+			@functools.wraps(func)
+			def wrapper(*args: Any, **kwargs: Any) -> Any:
+				if not self.enabled:
+					return func(*args, **kwargs)
+				start = time.perf_counter()
+				try:
+					return func(*args, **kwargs)
+				finally:
+					self.record(name, start, time.perf_counter() - start)
+
+			return wrapper  # type: ignore[return-value]
+
+		return decorator
+
+	def toJson(self) -> dict[str, Any]:
+		return {
+			"timers": {name: metric.toDict() for name, metric in self.timers.items()},
+			"counters": dict(self.counters),
+		}
+
+	def toTraceEvents(self) -> dict[str, Any]:
+		"""
+		Trace Event Format, viewable in chrome://tracing or Perfetto
+		"""
+		pid = os.getpid()
+		events = []
+		for phase, name, start, value in self.events:
+			ts = (start - self.origin) * 1e6
+			if phase == "X":
+				events.append({"name": name, "ph": "X", "ts": ts, "dur": value * 1e6, "pid": pid, "tid": 0})
+			else:
+				events.append({"name": name, "ph": "C", "ts": ts, "args": {"value": value}, "pid": pid, "tid": 0})
+		return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+	def export(self, path: Path | str, trace: bool = False) -> None:
+		"""
+		:param path: output file
+		:param trace: write trace events instead of the summary
+		"""
+		data = self.toTraceEvents() if trace else self.toJson()
+		Path(path).write_text(json.dumps(data), encoding="utf-8")
+
+
+telemetry = Telemetry()
+
+
+class LagMonitor(QObject):
+	"""
+	Event loop lag: how late a periodic timer fires, recorded as "eventloop.lag"
+	"""
+
+	def __init__(self, parent: QObject | None = None, interval: int = 100) -> None:
+		super().__init__(parent)
+		self._interval = interval
+		self._expected = 0.0
+		self._timer = QTimer(self, interval=interval)
+		self._timer.timeout.connect(self.__tick)
+		telemetry.lagMonitor = self
+		self.setRunning(telemetry.enabled)
+
+	def setRunning(self, running: bool) -> None:
+		if running and not self._timer.isActive():
+			self._expected = time.perf_counter() + self._interval / 1000
+			self._timer.start()
+		elif not running:
+			self._timer.stop()
+
+	def __tick(self) -> None:
+		now = time.perf_counter()
+		telemetry.record("eventloop.lag", self._expected, max(now - self._expected, 0.0))
+		self._expected = now + self._interval / 1000
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from PySide6.QtCore import QRegularExpression, Qt
+from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QTextDocument
+
+
+class TracebackSyntax(QSyntaxHighlighter):
+	"""
+	Highlighter of traceback lines (File "...", line n) in console output
+	"""
+
+	pattern: QRegularExpression = QRegularExpression(r'^\s*File "(?<file>[^"]+)", line (?<line>\d+)')
+	pattern.optimize()
+
+	def __init__(self, parent: QTextDocument | None = None) -> None:
+		super().__init__(parent)
+		self.format = QTextCharFormat()
+		self.format.setForeground(Qt.GlobalColor.blue)
+		self.format.setFontUnderline(True)
+
+	@classmethod
+	def location(cls, text: str) -> tuple[Path, int] | None:
+		"""
+		file and line of a traceback line
+
+		:param text: line of output
+		:return: (file, line) or None if it is not a traceback line
+		"""
+		mt = cls.pattern.match(text)
+		if not mt.hasMatch():
+			return None
+		return Path(mt.captured("file")), int(mt.captured("line"))
+
+	def highlightBlock(self, text: str) -> None:
+		mt = self.pattern.match(text)
+		if mt.hasMatch():
+			# link the file and line part only
+			self.setFormat(mt.capturedStart("file") - 1, mt.capturedEnd() - mt.capturedStart("file") + 1, self.format)
@@ -1 +1,3 @@
-from .PythonSyntax import PythonSyntax
+from .PythonSyntax import PythonSyntax, SyntaxRegistry, SyntaxRule, registry
+from .LineIndex import LineIndex
+from .TracebackSyntax import TracebackSyntax
\ No newline at end of file
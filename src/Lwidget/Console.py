@@ -1,12 +1,18 @@
+import bisect
 from pathlib import Path
 
-from PySide6.QtCore import QProcess, Qt, Signal, SignalInstance
-from PySide6.QtGui import QInputMethodEvent, QKeyEvent, QTextCursor
+from PySide6.QtCore import QProcess, Qt, QTimer, Signal, SignalInstance
+from PySide6.QtGui import QColor, QInputMethodEvent, QKeyEvent, QKeySequence, QMouseEvent, QResizeEvent, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import QTextEdit, QWidget
 
+from src.Lcore import LineIndex, TracebackSyntax
+from src.Lcore.Telemetry import telemetry
+from .FindBar import FindBar
+
 
 class Console(QTextEdit):
 	stateChanged: SignalInstance = Signal(bool)
+	openLocation: SignalInstance = Signal(Path, int)
 	cursorPositionChanged: SignalInstance
 
 	def __init__(self, parent: QWidget | None = None) -> None:
@@ -17,11 +23,30 @@ class Console(QTextEdit):
 		self.cursorPositionChanged.connect(self.cursorCheck)
 		self.__readOnly = False
 
+		self._traceback = TracebackSyntax(self.document())
+		self.viewport().setMouseTracking(True)
+
+		# line n of the index is block n of the document
+		self._index = LineIndex()
+		self._matches: list[int] = []
+		self._currentLine = -1
+		self._findBar = FindBar(self)
+		self._findBar.searchChanged.connect(self.__search)
+		self._findBar.findNext.connect(lambda: self.__find(True))
+		self._findBar.findPrevious.connect(lambda: self.__find(False))
+		self._findBar.closed.connect(self.__clearFind)
+		# keep the match count of a growing output up to date
+		self._refresh = QTimer(self, singleShot=True, interval=200)
+		self._refresh.timeout.connect(self.__refreshFind)
+
 	def append(self, text: str) -> None:
 		textCursor = self.textCursor()
 		textCursor.movePosition(QTextCursor.MoveOperation.End)
 		self.setTextCursor(textCursor)
 		self.insertPlainText(text)
+		self._index.feed(text)
+		if self._findBar.isVisible() and not self._refresh.isActive():
+			self._refresh.start()
 
 	def cursorCheck(self) -> None:
 		"""
@@ -35,6 +60,9 @@ class Console(QTextEdit):
 
 	def __begin(self) -> None:
 		self.clear()
+		self._index.clear()
+		self.__clearFind()
+		self.__refreshFind()
 		self.setReadOnly(False)
 		self.stateChanged.emit(True)
 
@@ -53,6 +81,9 @@ class Console(QTextEdit):
 
 	def keyPressEvent(self, ev: QKeyEvent) -> None:
 		print(f"keyPressed {ev.key()} {ev.text()}")
+		if ev.matches(QKeySequence.StandardKey.Find):
+			self.showFind()
+			return
 		if self.__readOnly and ev.text():
 			ev.ignore()
 			return
@@ -61,7 +92,112 @@ class Console(QTextEdit):
 			return
 		super().keyPressEvent(ev)
 		if ev.key() == Qt.Key.Key_Enter or ev.key() == Qt.Key.Key_Return:  #send last line to process
-			self.process_stdin(self.document().toPlainText().splitlines(keepends=True)[-1])
+			stdin = self.document().toPlainText().splitlines(keepends=True)[-1]
+			self.__syncIndexTail()
+			self.process_stdin(stdin)
+
+	def __syncIndexTail(self) -> None:
+		"""
+		typed input is mixed with output in the last lines, take them from the document
+		"""
+		document = self.document()
+		tail = [document.findBlockByNumber(n).text() for n in range(len(self._index) - 1, document.blockCount())]
+		if tail:
+			self._index.setTail(tail)
+
+	def mouseMoveEvent(self, ev: QMouseEvent) -> None:
+		super().mouseMoveEvent(ev)
+		if self.__locationAt(ev) is not None:
+			self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+		else:
+			self.viewport().setCursor(Qt.CursorShape.IBeamCursor)
+
+	def mouseReleaseEvent(self, ev: QMouseEvent) -> None:
+		super().mouseReleaseEvent(ev)
+		if ev.button() != Qt.MouseButton.LeftButton or self.textCursor().hasSelection():
+			return
+		location = self.__locationAt(ev)
+		if location is not None:
+			self.openLocation.emit(*location)
+
+	def __locationAt(self, ev: QMouseEvent) -> tuple[Path, int] | None:
+		return TracebackSyntax.location(self.cursorForPosition(ev.position().toPoint()).block().text())
+
+	def showFind(self) -> None:
+		self.__placeFindBar()
+		self._findBar.popup()
+
+	def resizeEvent(self, ev: QResizeEvent) -> None:
+		super().resizeEvent(ev)
+		self.__placeFindBar()
+
+	def __placeFindBar(self) -> None:
+		rect = self.viewport().geometry()
+		width = min(max(self._findBar.sizeHint().width(), 320), rect.width())
+		self._findBar.setGeometry(rect.right() - width, rect.top(), width, self._findBar.sizeHint().height())
+
+	def __search(self, text: str) -> None:
+		self._matches = self._index.search(text)
+		self._currentLine = -1
+		if self._matches:
+			# first match from the top of the view
+			self.__jump(self._matches[bisect.bisect_left(self._matches, self.cursorForPosition(self.viewport().rect().topLeft()).blockNumber()) % len(self._matches)])
+		else:
+			self.setExtraSelections([])
+		self.__showResult()
+
+	def __refreshFind(self) -> None:
+		self._matches = self._index.search(self._findBar.text)
+		self.__showResult()
+
+	def __find(self, forward: bool) -> None:
+		self._matches = self._index.search(self._findBar.text)
+		if not self._matches:
+			self.__showResult()
+			return
+		if forward:
+			i = bisect.bisect_right(self._matches, self._currentLine)
+		else:
+			i = bisect.bisect_left(self._matches, self._currentLine) - 1
+		self.__jump(self._matches[i % len(self._matches)])
+		self.__showResult()
+
+	def __showResult(self) -> None:
+		i = bisect.bisect_left(self._matches, self._currentLine)
+		current = i + 1 if i < len(self._matches) and self._matches[i] == self._currentLine else 0
+		self._findBar.setResult(current, len(self._matches))
+
+	def __jump(self, line: int) -> None:
+		"""
+		highlight the match in line and scroll to it, the text cursor (input) is kept
+		"""
+		block = self.document().findBlockByNumber(line)
+		if not block.isValid():
+			return
+		self._currentLine = line
+		query = self._findBar.text
+		column = block.text().casefold().find(query.casefold())
+		cursor = QTextCursor(block)
+		if column < 0:
+			cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+		else:
+			cursor.setPosition(block.position() + column)
+			cursor.setPosition(block.position() + column + len(query), QTextCursor.MoveMode.KeepAnchor)
+		fmt = QTextCharFormat()
+		fmt.setBackground(QColor(Qt.GlobalColor.yellow))
+		selection = QTextEdit.ExtraSelection()
+		selection.cursor = cursor
+		selection.format = fmt
+		self.setExtraSelections([selection])
+		rect = self.cursorRect(cursor)
+		scrollBar = self.verticalScrollBar()
+		if not self.viewport().rect().contains(rect):
+			scrollBar.setValue(scrollBar.value() + rect.center().y() - self.viewport().height() // 2)
+
+	def __clearFind(self) -> None:
+		self._matches = []
+		self._currentLine = -1
+		self.setExtraSelections([])
 
 	def process_stdin(self, stdin: str) -> None:
 		"""
@@ -73,6 +209,7 @@ class Console(QTextEdit):
 			return
 		self.process.write(stdin.encode("utf-8"))
 
+	@telemetry.timed("Console.process_stdout")
 	def process_stdout(self) -> None:
 		"""
 		receive stdout/stderror from process
@@ -80,6 +217,7 @@ class Console(QTextEdit):
 		if self.process is None:
 			return
 		dataBytes = bytes(self.process.readAll())
+		telemetry.count("Console.stdout.bytes", len(dataBytes))
 		try:
 			data = dataBytes.decode("utf-8")
 			self.append(data)
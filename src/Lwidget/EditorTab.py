@@ -1,8 +1,10 @@
 from PySide6.QtCore import Qt, Signal, SignalInstance
-from PySide6.QtGui import QCloseEvent, QFocusEvent, QFont, QFontMetricsF, QKeyEvent, QShowEvent, QWheelEvent
+from PySide6.QtGui import QCloseEvent, QFocusEvent, QFont, QFontMetricsF, QKeyEvent, QShowEvent, QTextCursor, QWheelEvent
 from PySide6.QtWidgets import QFileDialog, QTextEdit, QWidget, QMessageBox
 from pathlib import Path
 
+from src.Lcore.Telemetry import telemetry
+
 
 class EditorTab(QTextEdit):
 	titleChanged: SignalInstance = Signal(QWidget, str)
@@ -34,6 +36,7 @@ class EditorTab(QTextEdit):
 	def refreshTitle(self) -> None:
 		self.titleChanged.emit(self, self.title)
 
+	@telemetry.timed("EditorTab.save")
 	def __save(self) -> None:
 		# TODO custom | detect encoding
 		self.__path.write_text(self.toPlainText(), encoding="utf-8")
@@ -69,6 +72,7 @@ class EditorTab(QTextEdit):
 			return True
 		return False
 
+	@telemetry.timed("EditorTab.load")
 	def __load(self) -> None:
 		# TODO custom encoding & lazy loading
 		self.setText(self.__path.read_text(encoding="utf-8"))
@@ -85,6 +89,17 @@ class EditorTab(QTextEdit):
 			if result == QMessageBox.StandardButton.Yes:
 				self.document().setModified(True)
 
+	def gotoLine(self, line: int) -> None:
+		"""
+		:param line: line number, starts from 1
+		"""
+		block = self.document().findBlockByNumber(line - 1)
+		if not block.isValid():
+			return
+		self.setTextCursor(QTextCursor(block))
+		self.ensureCursorVisible()
+		self.setFocus()
+
 	def setTabWidth(self, tabWidth: int) -> None:
 		self.setTabStopDistance(QFontMetricsF(self.font()).horizontalAdvance(' ') * tabWidth)
 
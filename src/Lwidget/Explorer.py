@@ -2,10 +2,13 @@ import os
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QModelIndex, QObject, QPersistentModelIndex, QPoint, QRegularExpression, QSortFilterProxyModel, Qt, Signal, SignalInstance
-from PySide6.QtGui import QAction, QCursor
+from PySide6.QtCore import QModelIndex, QObject, QPersistentModelIndex, QPoint, QRegularExpression, QSortFilterProxyModel, Qt, QTimer, Signal, SignalInstance
+from PySide6.QtGui import QAction, QCursor, QPaintEvent
 from PySide6.QtWidgets import QFileSystemModel, QLineEdit, QMenu, QMessageBox, QTreeView, QWidget, QInputDialog
 
+from src.Lcore.Startup import startup
+from src.Lcore.Telemetry import telemetry
+
 
 class FileSystemModel(QFileSystemModel):
 	def __init__(self, parent: QObject | None = None) -> None:
@@ -26,10 +29,13 @@ class FileSystemModel(QFileSystemModel):
 
 
 class ExplorerModel(QSortFilterProxyModel):
+	directoryLoaded: SignalInstance = Signal(str)
+
 	def __init__(self, parent: QObject | None = None) -> None:
 		super().__init__(parent)
 		self._model = FileSystemModel(self)
 		self.setSourceModel(self._model)
+		self._model.directoryLoaded.connect(self.directoryLoaded)
 		self.filter: list[QRegularExpression] = []
 
 	def loadFilter(self, path: Path | str) -> None:
@@ -40,6 +46,7 @@ class ExplorerModel(QSortFilterProxyModel):
 		for pattern in path.read_text(encoding="utf-8").splitlines():
 			self.filter.append(QRegularExpression(pattern))
 
+	@telemetry.timed("ExplorerModel.filterAcceptsRow")
 	def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex | QPersistentModelIndex) -> bool:
 		index = self._model.index(source_row, 0, source_parent)
 		path = self._model.filePath(index)
@@ -50,6 +57,7 @@ class ExplorerModel(QSortFilterProxyModel):
 		for reg in self.filter:
 			mt = reg.match(name)
 			if mt.hasMatch():
+				telemetry.count("ExplorerModel.rejected")
 				return False
 		return True
 
@@ -153,6 +161,7 @@ class PopMenu(QMenu):
 
 class Explorer(QTreeView):
 	selectFile: SignalInstance = Signal(Path)
+	rootLoaded: SignalInstance = Signal(Path)
 	clicked: SignalInstance
 	customContextMenuRequested: SignalInstance
 
@@ -162,7 +171,10 @@ class Explorer(QTreeView):
 		self._path = Path()
 		self._popMenu: PopMenu = PopMenu(self)
 		self.setModel(self._model)
-		self.setPath(self._path)
+		self._model.directoryLoaded.connect(self.__directoryLoaded)
+		# scan the directory once the tree has been painted, see paintEvent
+		self.__scanPending = True
+		self.__scanQueued = False
 
 		self.setExpandsOnDoubleClick(False)
 		self.clicked.connect(self.clickExpand)
@@ -185,10 +197,28 @@ class Explorer(QTreeView):
 			if path.endswith(".py"):
 				self.selectFile.emit(Path(path))
 
+	def paintEvent(self, event: QPaintEvent) -> None:
+		super().paintEvent(event)
+		if self.__scanPending and not self.__scanQueued:
+			self.__scanQueued = True
+			QTimer.singleShot(0, self.__initialScan)
+
+	def __initialScan(self) -> None:
+		if not self.__scanPending:
+			return
+		self.setPath(self._path)
+
+	def __directoryLoaded(self, path: str) -> None:
+		if Path(path) != self._path:
+			return
+		startup.mark("explorer scan")
+		self.rootLoaded.emit(self._path)
+
 	def setPath(self, path: Path | str = '.') -> None:
 		tmp = Path(path)
 		if not tmp.exists() or not tmp.is_dir():
 			return
+		self.__scanPending = False
 		self._path = tmp.resolve()
 		self.setRootIndex(self._model.setRootPath(str(self._path)))
 		self._popMenu.setRootPath(self._path)
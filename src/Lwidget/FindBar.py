@@ -0,0 +1,90 @@
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer, Signal, SignalInstance
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QLineEdit, QToolButton, QWidget
+
+
+class FindBar(QFrame):
+	"""
+	Incremental find bar, searching is left to the owner
+	"""
+	searchChanged: SignalInstance = Signal(str)
+	findNext: SignalInstance = Signal()
+	findPrevious: SignalInstance = Signal()
+	closed: SignalInstance = Signal()
+
+	def __init__(self, parent: QWidget | None = None) -> None:
+		super().__init__(parent)
+		self.setFrameShape(QFrame.Shape.StyledPanel)
+		self.setAutoFillBackground(True)
+
+		self._input = QLineEdit(self)
+		self._input.setPlaceholderText("查找")
+		self._result = QLabel(self)
+		self._result.setMinimumWidth(80)
+		self._previous = QToolButton(self, text="↑", toolTip="上一个 (Shift+Enter)")
+		self._next = QToolButton(self, text="↓", toolTip="下一个 (Enter)")
+		self._close = QToolButton(self, text="×", toolTip="关闭 (Esc)")
+
+		layout = QHBoxLayout(self)
+		layout.setContentsMargins(4, 2, 4, 2)
+		layout.addWidget(self._input)
+		layout.addWidget(self._result)
+		layout.addWidget(self._previous)
+		layout.addWidget(self._next)
+		layout.addWidget(self._close)
+		self.setLayout(layout)
+
+		# search once typing pauses instead of every keystroke
+		self._delay = QTimer(self, singleShot=True, interval=150)
+		self._delay.timeout.connect(lambda: self.searchChanged.emit(self._input.text()))
+		self._input.textChanged.connect(lambda _: self._delay.start())
+		self._input.installEventFilter(self)
+		self._previous.clicked.connect(self.findPrevious)
+		self._next.clicked.connect(self.findNext)
+		self._close.clicked.connect(self.dismiss)
+		self.hide()
+
+	@property
+	def text(self) -> str:
+		return self._input.text()
+
+	def setResult(self, current: int, total: int) -> None:
+		"""
+		:param current: index of current match, starts from 1, 0 if none
+		:param total: number of matches
+		"""
+		if not self._input.text():
+			self._result.clear()
+		elif total == 0:
+			self._result.setText("无结果")
+		else:
+			self._result.setText(f"{current}/{total}")
+
+	def popup(self) -> None:
+		self.show()
+		self.raise_()
+		self._input.setFocus()
+		self._input.selectAll()
+
+	def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+		if watched is self._input and event.type() == QEvent.Type.KeyPress:
+			key = event.key()
+			if key == Qt.Key.Key_Escape:
+				self.dismiss()
+				return True
+			if key in (Qt.Key.Key_Enter, Qt.Key.Key_Return):
+				if self._delay.isActive():  # search the latest text first
+					self._delay.stop()
+					self.searchChanged.emit(self._input.text())
+				if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+					self.findPrevious.emit()
+				else:
+					self.findNext.emit()
+				return True
+		return super().eventFilter(watched, event)
+
+	def dismiss(self) -> None:
+		"""
+		hide on user request (Esc / ×), unlike hiding with the window
+		"""
+		self.hide()
+		self.closed.emit()
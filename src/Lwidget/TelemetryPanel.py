@@ -0,0 +1,134 @@
+from PySide6.QtCore import QRectF, Qt, QTimer
+from PySide6.QtGui import QHideEvent, QPainter, QPaintEvent, QShowEvent
+from PySide6.QtWidgets import (QAbstractItemView, QCheckBox, QDockWidget, QFileDialog, QHBoxLayout, QPushButton, QSplitter, QTableWidget, QTableWidgetItem, QVBoxLayout,
+							   QWidget)
+
+from src.Lcore.Telemetry import Metric, telemetry
+
+
+class Histogram(QWidget):
+	"""
+	Bars of the log2 duration buckets of a metric
+	"""
+
+	def __init__(self, parent: QWidget | None = None) -> None:
+		super().__init__(parent)
+		self._metric: Metric | None = None
+		self.setMinimumHeight(120)
+
+	def setMetric(self, metric: Metric | None) -> None:
+		self._metric = metric
+		self.update()
+
+	def paintEvent(self, event: QPaintEvent) -> None:
+		painter = QPainter(self)
+		painter.fillRect(self.rect(), self.palette().base())
+		if self._metric is None or self._metric.count == 0:
+			painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "选择一项查看分布")
+			return
+		# only the range of buckets in use
+		used = [i for i, n in enumerate(self._metric.buckets) if n]
+		first, last = used[0], used[-1]
+		peak = max(self._metric.buckets)
+		labelHeight = painter.fontMetrics().height()
+		width = self.width() / (last - first + 1)
+		height = self.height() - labelHeight * 2
+		for column, i in enumerate(range(first, last + 1)):
+			n = self._metric.buckets[i]
+			x = column * width
+			bar = height * n / peak
+			painter.fillRect(QRectF(x + 1, labelHeight + height - bar, width - 2, bar), self.palette().highlight())
+			if n:
+				painter.drawText(QRectF(x, labelHeight + height - bar - labelHeight, width, labelHeight), Qt.AlignmentFlag.AlignCenter, str(n))
+			painter.drawText(QRectF(x, self.height() - labelHeight, width, labelHeight), Qt.AlignmentFlag.AlignCenter, Metric.bucketLabel(i))
+
+
+class TelemetryPanel(QDockWidget):
+	"""
+	Timers, counters and histograms of the IDE itself
+	"""
+
+	def __init__(self, parent: QWidget | None = None) -> None:
+		super().__init__("性能", parent)
+		widget = QWidget(self)
+		layout = QVBoxLayout(widget)
+
+		bar = QHBoxLayout()
+		self._enable = QCheckBox("启用", widget)
+		self._enable.setChecked(telemetry.enabled)
+		self._enable.toggled.connect(telemetry.setEnabled)
+		self._reset = QPushButton("重置", widget, clicked=self.reset)
+		self._exportJson = QPushButton("导出 JSON", widget, clicked=lambda: self.export(False))
+		self._exportTrace = QPushButton("导出 Trace", widget, clicked=lambda: self.export(True))
+		bar.addWidget(self._enable)
+		bar.addStretch()
+		bar.addWidget(self._reset)
+		bar.addWidget(self._exportJson)
+		bar.addWidget(self._exportTrace)
+		layout.addLayout(bar)
+
+		splitter = QSplitter(Qt.Orientation.Vertical, widget)
+		self._table = QTableWidget(0, 5, splitter)
+		self._table.setHorizontalHeaderLabels(["名称", "次数", "总计 ms", "平均 ms", "最大 ms"])
+		self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+		self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+		self._table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+		self._table.verticalHeader().hide()
+		self._table.itemSelectionChanged.connect(self.__selectMetric)
+		self._histogram = Histogram(splitter)
+		splitter.addWidget(self._table)
+		splitter.addWidget(self._histogram)
+		layout.addWidget(splitter)
+
+		widget.setLayout(layout)
+		self.setWidget(widget)
+
+		self._refresh = QTimer(self, interval=1000)
+		self._refresh.timeout.connect(self.refresh)
+
+	def refresh(self) -> None:
+		selected = self.__selectedName()
+		rows: list[tuple[str, str, str, str, str]] = []
+		for name, metric in sorted(telemetry.timers.items()):
+			rows.append((name, str(metric.count), f"{metric.total * 1000:.2f}", f"{metric.mean * 1000:.3f}", f"{metric.max * 1000:.3f}"))
+		for name, value in sorted(telemetry.counters.items()):
+			rows.append((name, str(value), "", "", ""))
+		self._table.blockSignals(True)
+		self._table.setRowCount(len(rows))
+		for row, values in enumerate(rows):
+			for column, value in enumerate(values):
+				item = QTableWidgetItem(value)
+				if column > 0:
+					item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+				self._table.setItem(row, column, item)
+			if values[0] == selected:
+				self._table.selectRow(row)
+		self._table.blockSignals(False)
+		self.__selectMetric()
+
+	def __selectedName(self) -> str | None:
+		items = self._table.selectedItems()
+		return self._table.item(items[0].row(), 0).text() if items else None
+
+	def __selectMetric(self) -> None:
+		self._histogram.setMetric(telemetry.timers.get(self.__selectedName()))
+
+	def reset(self) -> None:
+		telemetry.reset()
+		self.refresh()
+
+	def export(self, trace: bool) -> None:
+		filename, _ = QFileDialog.getSaveFileName(self, "导出", filter="*.json")
+		if not filename:
+			return
+		telemetry.export(filename, trace)
+
+	def showEvent(self, event: QShowEvent) -> None:
+		self._enable.setChecked(telemetry.enabled)
+		self.refresh()
+		self._refresh.start()
+		super().showEvent(event)
+
+	def hideEvent(self, event: QHideEvent) -> None:
+		self._refresh.stop()
+		super().hideEvent(event)
@@ -2,3 +2,5 @@ from .Console import Console
 from .Explorer import Explorer
 from .TabManager import TabManager
 from .EditorTab import EditorTab
+from .FindBar import FindBar
+from .TelemetryPanel import TelemetryPanel
\ No newline at end of file
@@ -1,17 +1,48 @@
 import sys
 
+from src.Lcore.Startup import startup
+
+from PySide6.QtCore import QEvent, QObject, QTimer
 from PySide6.QtWidgets import QApplication
 
+startup.mark("import Qt")
+
 from ui import Ui_Main
 
+startup.mark("import ui")
+
 
 class MainWindow(Ui_Main):
 	def __init__(self) -> None:
 		super().__init__()
+		if startup.enabled:
+			self.installEventFilter(self)
+
+	def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+		if watched is self and event.type() == QEvent.Type.Paint and not startup.has("first paint"):
+			startup.mark("first paint")
+			# the first idle turn of the event loop after painting
+			QTimer.singleShot(0, self.__interactive)
+		return super().eventFilter(watched, event)
+
+	def __interactive(self) -> None:
+		startup.mark("interactive")
+		if not startup.exitWhenInteractive:
+			return
+		# wait for the explorer scan deferred past the first paint
+		if startup.has("explorer scan"):
+			self.close()
+		else:
+			self.explorer.rootLoaded.connect(self.close)
+			QTimer.singleShot(10000, self.close)
 
 
 if __name__ == '__main__':
 	app = QApplication(sys.argv)
+	startup.mark("QApplication")
 	mainwin = MainWindow()
+	startup.mark("construct main window")
 	mainwin.show()
-	sys.exit(app.exec())
+	ret = app.exec()
+	startup.dump()
+	sys.exit(ret)
@@ -1,31 +1,49 @@
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt, SignalInstance
 from PySide6.QtGui import QAction, QCloseEvent, QKeySequence
 from PySide6.QtWidgets import QFileDialog, QGridLayout, QMainWindow, QMenu, QSplitter, QWidget
 
-from src.Lwidget import Console, Explorer, TabManager, EditorTab
-from src.Lcore import PythonSyntax
+from src.Lcore.Startup import startup
+from src.Lcore.Telemetry import LagMonitor
+from src.Lwidget import Console, Explorer, TabManager
+
+if TYPE_CHECKING:
+	from src.Lwidget import EditorTab, TelemetryPanel
 
 
 class EditorTabManager(TabManager):
 	def __init__(self, parent: QWidget | None) -> None:
 		super().__init__(parent)
+		self.currentChanged.connect(self.__currentChanged)
+
+	def __currentChanged(self, index: int) -> None:
+		tab = self.widget(index)
+		if tab is None:
+			return
+		from src.Lcore import registry
+		registry.showDocument(tab.document())
 
-	def addTab(self, tab: EditorTab, text: str = None) -> int:
+	def addTab(self, tab: "EditorTab", text: str = None) -> int:
 		if text is None:
 			text = tab.title
+		# the highlighter is only needed once a file is opened
+		from src.Lcore import PythonSyntax, registry
 		PythonSyntax(tab.document())
+		registry.registerEditor(tab)
 		return super().addTab(tab, text)
 
-	def widget(self, index: int) -> EditorTab | None:
+	def widget(self, index: int) -> "EditorTab | None":
+		from src.Lwidget import EditorTab
 		ret = super().widget(index)
 		if isinstance(ret, EditorTab):  # always True
 			return ret
 		else:
 			return None
 
-	def currentWidget(self) -> EditorTab | None:
+	def currentWidget(self) -> "EditorTab | None":
+		from src.Lwidget import EditorTab
 		ret = super().currentWidget()
 		if isinstance(ret, EditorTab):  # always True
 			return ret
@@ -38,6 +56,8 @@ class Ui_Main(QMainWindow):
 		super().__init__(parent)
 		self.setWindowTitle("Code")
 		self.resize(1080, 720)
+		self._lagMonitor = LagMonitor(self)
+		self._telemetryPanel: "TelemetryPanel | None" = None
 		self.__build_main()
 		self.__build_menu()
 		self.__build_connect()
@@ -78,6 +98,8 @@ class Ui_Main(QMainWindow):
 		self._action_paste = QAction(text="粘贴", triggered=self.pasteText, shortcut=Key.Paste)
 		self._action_run = QAction(text="运行", triggered=self.runCode, shortcut="Shift+F")
 		self._action_stop = QAction(text="停止", triggered=self.console.stop, shortcut="Alt+Shift+F")
+		self._action_telemetry = QAction(text="性能面板", triggered=self.showTelemetry)
+		self._action_findOutput = QAction(text="查找输出", triggered=self.console.showFind, shortcut="Ctrl+Alt+F")
 
 		menuBar = self.menuBar()
 
@@ -99,14 +121,25 @@ class Ui_Main(QMainWindow):
 		self._menu_run = QMenu("运行", menuBar)
 		self._menu_run.addAction(self._action_run)
 		self._menu_run.addAction(self._action_stop)
+		self._menu_run.addSeparator()
+		self._menu_run.addAction(self._action_findOutput)
 		menuBar.addAction(self._menu_run.menuAction())
 
+		self._menu_view = QMenu("视图", menuBar)
+		self._menu_theme = QMenu("主题", self._menu_view)
+		# themes live with the highlighter, load them when first shown
+		self._menu_theme.aboutToShow.connect(self.__loadThemes)
+		self._menu_view.addMenu(self._menu_theme)
+		self._menu_view.addAction(self._action_telemetry)
+		menuBar.addAction(self._menu_view.menuAction())
+
 		self.__consoleStateChanged(False)
 		self.__tabCountChanged(0)
 
 	def __build_connect(self) -> None:
 		self.explorer.selectFile.connect(self.__addTab)
 		self.console.stateChanged.connect(self.__consoleStateChanged)
+		self.console.openLocation.connect(self.__openLocation)
 		self.tabManager.countChanged.connect(self.__tabCountChanged)
 
 	def __addTab(self, path: Path | None) -> None:
@@ -114,8 +147,32 @@ class Ui_Main(QMainWindow):
 			if self.tabManager.widget(i).path.samefile(path):
 				self.tabManager.setCurrentIndex(i)
 				return
+		from src.Lwidget import EditorTab
 		tab = EditorTab(self.tabManager, path)
 		self.tabManager.setCurrentIndex(self.tabManager.addTab(tab))
+		startup.mark("first file open")
+
+	def __openLocation(self, path: Path, line: int) -> None:
+		if not path.is_file():
+			return
+		self.__addTab(path)
+		self.tabManager.currentWidget().gotoLine(line)
+
+	def __loadThemes(self) -> None:
+		from src.Lcore import registry
+		self._menu_theme.clear()
+		for theme in registry.themes:
+			action = QAction(text=theme, parent=self._menu_theme, checkable=True, checked=theme == registry.theme)
+			action.triggered.connect(lambda _, name=theme: registry.setTheme(name))
+			self._menu_theme.addAction(action)
+
+	def showTelemetry(self) -> None:
+		if self._telemetryPanel is None:
+			from src.Lwidget import TelemetryPanel
+			self._telemetryPanel = TelemetryPanel(self)
+			self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self._telemetryPanel)
+		self._telemetryPanel.show()
+		self._telemetryPanel.raise_()
 
 	def __consoleStateChanged(self, state: bool) -> None:
 		self._action_run.setEnabled(not state)
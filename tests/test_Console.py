@@ -0,0 +1,64 @@
+import os
+import random
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtCore = pytest.importorskip("PySide6.QtCore")
+from PySide6.QtGui import QKeyEvent
+from PySide6.QtWidgets import QApplication
+
+from src.Lwidget import Console
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+	return QApplication.instance() or QApplication([])
+
+
+def blocks(console: Console) -> list[str]:
+	document = console.document()
+	return [document.findBlockByNumber(n).text().casefold() for n in range(document.blockCount())]
+
+
+def test_index_matches_document(app: QApplication) -> None:
+	rng = random.Random(0)
+	for _ in range(200):
+		console = Console()
+		for _ in range(rng.randint(1, 20)):
+			console.append("".join(rng.choice("aB \r\n ") for _ in range(rng.randint(0, 8))))
+		assert console._index.lines == blocks(console)
+
+
+def test_split_crlf_search(app: QApplication) -> None:
+	console = Console()
+	for i in range(40):
+		console.append(f"line {i}\r")
+		console.append("\n")
+	line = console._index.search("line 30")[0]
+	assert console.document().findBlockByNumber(line).text() == "line 30"
+
+
+def test_typed_input_after_prompt(app: QApplication) -> None:
+	console = Console()
+	console.setReadOnly(False)
+	console.append("Name: ")
+	console.insertPlainText("abc")
+	console.keyPressEvent(QKeyEvent(QKeyEvent.Type.KeyPress, QtCore.Qt.Key.Key_Return, QtCore.Qt.KeyboardModifier.NoModifier, "\r"))
+	console.append("hello abc\n")
+	assert console._index.lines == blocks(console)
+	assert console._index.lines[0] == "name: abc"
+
+
+def test_find_highlight_survives_window_hide(app: QApplication) -> None:
+	console = Console()
+	console.append("alpha\nbeta\nalpha\n")
+	console.show()
+	console.showFind()
+	console._findBar.searchChanged.emit("alpha")
+	assert len(console.extraSelections()) == 1
+	console.hide()
+	console.show()
+	assert len(console.extraSelections()) == 1
+	console._findBar.dismiss()
+	assert console.extraSelections() == []
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+pytest.importorskip("PySide6")
+from src.Lcore import LineIndex
+
+
+def brute(lines: list[str], query: str) -> list[int]:
+	query = query.casefold()
+	return [n for n, line in enumerate(lines) if query in line.casefold()] if query else []
+
+
+def test_incremental_search() -> None:
+	index = LineIndex()
+	index.feed("Alpha\nbeta\nALPHABET\n")
+	assert index.search("alpha") == [0, 2]
+	index.feed("alpha again\npartial alp")
+	assert index.search("alpha") == [0, 2, 3]
+	index.feed("ha\n")
+	assert index.search("alpha") == [0, 2, 3, 4]
+
+
+def test_prefix_refinement() -> None:
+	index = LineIndex()
+	index.feed("alpha\nalps\nalphabet\nbeta\n")
+	assert index.search("alp") == [0, 1, 2]
+	assert index.search("alpha") == [0, 2]
+	index.feed("alphabet soup\n")
+	assert index.search("alphab") == [2, 4]
+	assert index.search("alp") == [0, 1, 2, 4]
+
+
+def test_cache_eviction() -> None:
+	index = LineIndex()
+	index.feed("".join(f"line {n}\n" for n in range(50)))
+	queries = [f"line {n}" for n in range(LineIndex.cacheSize * 2)]
+	for query in queries:
+		index.search(query)
+	index.feed("line 0 again\n")
+	for query in queries:
+		assert index.search(query) == brute(index.lines, query)
+
+
+def test_set_tail() -> None:
+	index = LineIndex()
+	index.feed("Name: ")
+	assert index.search("name") == [0]
+	index.setTail(["Name: Alice", ""])
+	assert index.lines == ["name: alice", ""]
+	assert index.search("alice") == [0]
+	assert index.search("name: a") == [0]
+
+
+def test_random_against_brute_force() -> None:
+	rng = random.Random(0)
+	index = LineIndex()
+	lines = [""]
+	for _ in range(2000):
+		action = rng.random()
+		if action < 0.5:
+			text = "".join(rng.choice("abAB\n") for _ in range(rng.randint(0, 10)))
+			index.feed(text)
+			parts = text.split("\n")
+			lines[-1] += parts[0]
+			lines.extend(parts[1:])
+		elif action < 0.6:
+			tail = ["".join(rng.choice("abAB") for _ in range(rng.randint(0, 5))) for _ in range(rng.randint(1, 3))]
+			index.setTail(tail)
+			lines[-1:] = tail
+		query = "".join(rng.choice("ab") for _ in range(rng.randint(0, 3)))
+		assert index.search(query) == brute(lines, query)
+		assert index.lines == [line.casefold() for line in lines]